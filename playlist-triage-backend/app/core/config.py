@@ -1,7 +1,7 @@
 """Configuration management for the application."""
 
-import logging
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -34,10 +34,26 @@ class Settings(BaseSettings):
 
     # API Configuration
     API_V1_PREFIX: str = Field(default="/api/v1", description="API version 1 prefix")
+    ENABLE_CORS: bool = Field(
+        default=True,
+        description="Enable CORS middleware (off when a reverse proxy handles CORS)",
+    )
     CORS_ORIGINS: list[str] = Field(
         default=["http://localhost:3000", "http://localhost:8000"],
         description="Allowed CORS origins",
     )
+    ALLOWED_HOSTS: list[str] = Field(
+        default=["*"],
+        description="Hosts accepted in production; '*' disables host checking",
+    )
+    ENABLE_API_DOCS: bool = Field(
+        default=False,
+        description="Serve /docs, /redoc and /openapi.json outside development",
+    )
+    OPENAPI_SCHEMA_PATH: str = Field(
+        default="openapi.json",
+        description="Prebuilt OpenAPI schema served outside development",
+    )
 
     # Security Configuration
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(
@@ -76,9 +92,17 @@ class Settings(BaseSettings):
         """Check if running in production environment."""
         return self.ENVIRONMENT == "production"
 
+    def api_docs_enabled(self) -> bool:
+        """Check if the API docs and OpenAPI schema are served."""
+        return self.is_development() or self.ENABLE_API_DOCS
+
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings singleton."""
+    """Get application settings singleton.
+
+    Cached so the environment and ``.env`` file are parsed once per process.
+    """
     return Settings()  # pyright: ignore[reportCallIssue]
 
 
@@ -1,27 +1,31 @@
 """Dependency injection setup for the application."""
 
-from typing import AsyncGenerator
+from typing import Optional
 
 import httpx
 from fastapi import Depends, HTTPException, Request
-from fastapi.security import HTTPBearer
 
-from app.core.config import settings
-from app.core.exceptions import AuthenticationException
+from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.services.spotify_service import SpotifyService
 
 logger = get_logger(__name__)
-security = HTTPBearer(auto_error=False)
 
+# One pooled HTTP/2 client serves every request; Spotify calls multiplex over
+# a few long-lived connections instead of paying TCP/TLS setup each time
+HTTP_TIMEOUT = httpx.Timeout(10.0)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
 
-async def get_http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
-    """Provide HTTP client dependency."""
-    async with httpx.AsyncClient(
-        timeout=httpx.Timeout(30.0),
-        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
-    ) as client:
-        yield client
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the application-wide HTTP client used for Spotify calls."""
+    return httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Provide the application-wide HTTP client created at startup."""
+    client: httpx.AsyncClient = request.app.state.http_client
+    return client
 
 
 async def get_spotify_service(
@@ -31,34 +35,29 @@ async def get_spotify_service(
     return SpotifyService(client)
 
 
-def get_access_token_from_request(request: Request) -> str:
-    """Extract access token from request cookies or Authorization header."""
-    # Try to get token from cookie first
-    token = request.cookies.get("access_token")
-    
-    if not token:
-        # Try to get from Authorization header
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ", 1)[1]
-    
-    if not token:
-        logger.warning("No access token found in request")
-        raise AuthenticationException("Access token required")
-    
-    return token
+def _parse_bearer_token(auth_header: Optional[str]) -> Optional[str]:
+    """Extract the token from a ``Bearer <token>`` Authorization header."""
+    if not auth_header:
+        return None
+    scheme, _, token = auth_header.partition(" ")
+    return token if scheme == "Bearer" and token else None
 
 
 async def get_current_user_token(
     request: Request,
 ) -> str:
-    """Get and validate current user's access token."""
-    try:
-        return get_access_token_from_request(request)
-    except AuthenticationException:
+    """Get current user's access token from the cookie or Authorization header."""
+    token = request.cookies.get("access_token") or _parse_bearer_token(
+        request.headers.get("Authorization")
+    )
+    
+    if not token:
+        logger.warning("No access token found in request")
         raise HTTPException(status_code=401, detail="Authentication required")
+    
+    return token
 
 
 def get_current_settings():
     """Provide application settings dependency."""
-    return settings
\ No newline at end of file
+    return get_settings()
\ No newline at end of file
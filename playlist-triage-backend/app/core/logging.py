@@ -1,25 +1,53 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from app.core.config import settings
 
+LOG_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - "
+    "%(module)s:%(lineno)d - %(message)s"
+)
+
+# Background listener that drains queued log records to stdout
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging() -> None:
-    """Set up application logging configuration."""
+    """Set up application logging configuration.
+    
+    Records are handed to a queue on the calling thread and written to stdout
+    by a background listener, so request handlers never block on log I/O.
+    Calling it again while the listener is running does nothing.
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        return
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(shutdown_logging)
+    
+    # Only merge args into the message here; the listener applies LOG_FORMAT
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
     
     # Configure root logger
     logging.basicConfig(
         level=getattr(logging, settings.LOG_LEVEL),
-        format=(
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "%(module)s:%(lineno)d - %(message)s"
-        ),
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[queue_handler]
     )
     
     # Configure specific loggers
@@ -40,6 +68,15 @@ def setup_logging() -> None:
         logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
+def shutdown_logging() -> None:
+    """Stop the background log listener, flushing any queued records."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for the given name."""
     return logging.getLogger(name)
\ No newline at end of file
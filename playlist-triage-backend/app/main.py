@@ -1,13 +1,16 @@
 """Main FastAPI application with improved structure and middleware."""
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.core.config import settings
+from app.core.dependencies import create_http_client
 from app.core.logging import setup_logging, get_logger
 from app.middleware.error_handling import error_handling_middleware
 from app.routers import auth, health, triage
@@ -25,10 +28,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
     
+    # Shared HTTP client so outbound Spotify calls reuse pooled connections
+    app.state.http_client = create_http_client()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    await app.state.http_client.aclose()
 
 
 # Create FastAPI application
@@ -36,27 +43,55 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Backend API for song playlist triage and organization",
-    docs_url="/docs" if settings.is_development() else None,
-    redoc_url="/redoc" if settings.is_development() else None,
-    openapi_url="/openapi.json" if settings.is_development() else None,
+    docs_url="/docs" if settings.api_docs_enabled() else None,
+    redoc_url="/redoc" if settings.api_docs_enabled() else None,
+    openapi_url="/openapi.json" if settings.api_docs_enabled() else None,
     lifespan=lifespan,
 )
 
-# Add security middleware
-if settings.is_production():
+
+def load_prebuilt_openapi_schema(app: FastAPI, schema_file: Path) -> bool:
+    """Serve a schema generated at build time instead of building it live.
+    
+    The schema comes from python -m app.tools.dump_openapi and saves
+    introspecting every route on the first /openapi.json request. Nothing is
+    loaded when the app does not serve its schema or the file is missing.
+    """
+    if app.openapi_url is None or not schema_file.is_file():
+        return False
+    schema: Dict[str, Any] = orjson.loads(schema_file.read_bytes())
+    
+    # FastAPI regenerates openapi_schema whenever routes change, so replace
+    # the generator itself rather than pre-filling the cached attribute
+    def prebuilt_openapi() -> Dict[str, Any]:
+        return schema
+    
+    app.openapi = prebuilt_openapi  # type: ignore[method-assign]
+    logger.info(f"Loaded prebuilt OpenAPI schema from {schema_file}")
+    return True
+
+
+# Development always builds the schema live so the docs track code changes
+if not settings.is_development():
+    load_prebuilt_openapi_schema(app, Path(settings.OPENAPI_SCHEMA_PATH))
+
+# Add security middleware; a wildcard host list would allow every request
+# through, so only install it when real hosts are configured
+if settings.is_production() and "*" not in settings.ALLOWED_HOSTS:
     app.add_middleware(
         TrustedHostMiddleware,
-        allowed_hosts=["*"]  # Configure based on your domain
+        allowed_hosts=settings.ALLOWED_HOSTS,
     )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE"],
-    allow_headers=["*"],
-)
+# Add CORS middleware (can be disabled when a reverse proxy handles CORS)
+if settings.ENABLE_CORS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE"],
+        allow_headers=["Authorization", "Content-Type", "Accept"],
+    )
 
 # Add custom error handling middleware
 app.middleware("http")(error_handling_middleware)
@@ -67,15 +102,19 @@ app.include_router(auth.router)
 app.include_router(triage.router)
 
 
+# Root payload depends only on settings, so serialize it once at import
+_ROOT_BODY = orjson.dumps({
+    "message": f"Welcome to {settings.APP_NAME}",
+    "version": settings.APP_VERSION,
+    "environment": settings.ENVIRONMENT,
+    "docs_url": "/docs" if settings.api_docs_enabled() else "Contact admin for API documentation",
+    "health_check": "/health"
+})
+
+
 @app.get("/", summary="Root endpoint")
-def root() -> dict:
+async def root() -> Response:
     """
     Root endpoint providing basic API information.
     """
-    return {
-        "message": f"Welcome to {settings.APP_NAME}",
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT,
-        "docs_url": "/docs" if settings.is_development() else "Contact admin for API documentation",
-        "health_check": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
@@ -1,53 +1,73 @@
 """Middleware for error handling and request processing."""
 
+import itertools
+import logging
+import os
 import time
-import uuid
-from typing import Callable
+from typing import Any, Callable, Dict
 
+import orjson
 from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
 
 from app.core.exceptions import AppException
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Per-process request counter; combined with the PID it gives unique request IDs
+_request_counter = itertools.count()
+
+# Requests slower than this are always logged
+SLOW_REQUEST_SECONDS = 0.5
+
+# Probe endpoints polled by the orchestrator; only logged when failing or slow
+_PROBE_PATHS = frozenset({"/health/live", "/health/ready"})
+
 
 async def error_handling_middleware(request: Request, call_next: Callable) -> Response:
     """Middleware to handle application errors and provide consistent error responses."""
     
     # Generate request ID for tracing
-    request_id = str(uuid.uuid4())
+    request_id = f"{os.getpid():x}-{next(_request_counter):x}"
     request.state.request_id = request_id
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         response = await call_next(request)
         
-        # Log successful requests
-        duration = time.time() - start_time
-        logger.info(
-            f"Request completed - {request.method} {request.url.path} - "
-            f"Status: {response.status_code} - Duration: {duration:.3f}s - "
-            f"Request ID: {request_id}"
-        )
+        # Log failed or slow requests; everything else only at DEBUG level
+        duration = time.perf_counter() - start_time
+        if (
+            response.status_code >= 400
+            or duration > SLOW_REQUEST_SECONDS
+            or (
+                logger.isEnabledFor(logging.DEBUG)
+                and request.url.path not in _PROBE_PATHS
+            )
+        ):
+            logger.info(
+                "Request completed - %s %s - Status: %s - Duration: %.3fs - "
+                "Request ID: %s",
+                request.method, request.url.path, response.status_code, duration,
+                request_id,
+            )
         
         return response
         
     except AppException as e:
         # Handle known application exceptions
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         logger.warning(
-            f"Application error - {request.method} {request.url.path} - "
-            f"Error: {e.message} - Duration: {duration:.3f}s - "
-            f"Request ID: {request_id}",
+            "Application error - %s %s - Error: %s - Duration: %.3fs - "
+            "Request ID: %s",
+            request.method, request.url.path, e.message, duration, request_id,
             extra={"details": e.details}
         )
         
-        return JSONResponse(
-            status_code=e.status_code,
-            content={
+        return _json_response(
+            e.status_code,
+            {
                 "error": {
                     "message": e.message,
                     "details": e.details,
@@ -59,21 +79,30 @@ async def error_handling_middleware(request: Request, call_next: Callable) -> Re
         
     except Exception as e:
         # Handle unexpected exceptions
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         logger.error(
-            f"Unexpected error - {request.method} {request.url.path} - "
-            f"Error: {str(e)} - Duration: {duration:.3f}s - "
-            f"Request ID: {request_id}",
+            "Unexpected error - %s %s - Error: %s - Duration: %.3fs - "
+            "Request ID: %s",
+            request.method, request.url.path, e, duration, request_id,
             exc_info=True
         )
         
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
+        return _json_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {
                 "error": {
                     "message": "An unexpected error occurred",
                     "request_id": request_id,
                     "type": "InternalServerError"
                 }
             }
-        )
\ No newline at end of file
+        )
+
+
+def _json_response(status_code: int, content: Dict[str, Any]) -> Response:
+    """Build a JSON error response serialized with orjson."""
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
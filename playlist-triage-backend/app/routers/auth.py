@@ -1,9 +1,12 @@
 """Authentication router with improved structure and error handling."""
 
 import base64
+from functools import lru_cache
 from typing import Dict, Any
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
 
@@ -19,13 +22,14 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 # Spotify OAuth configuration
 SPOTIFY_AUTH_URL = "https://accounts.spotify.com/authorize"
 SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
-SPOTIFY_SCOPES = [
+SPOTIFY_SCOPES = (
     "playlist-read-private",
     "playlist-modify-public", 
     "playlist-modify-private",
     "user-library-read",
-    "user-read-private"
-]
+    "user-read-private",
+)
+SPOTIFY_SCOPE = " ".join(SPOTIFY_SCOPES)
 
 
 @router.get("/login", summary="Initiate Spotify OAuth login")
@@ -37,17 +41,9 @@ def login(settings: Settings = Depends(get_current_settings)) -> RedirectRespons
     """
     logger.info("Initiating Spotify OAuth login")
     
-    auth_params = {
-        "client_id": settings.SPOTIFY_CLIENT_ID,
-        "response_type": "code",
-        "redirect_uri": settings.SPOTIFY_REDIRECT_URI,
-        "scope": " ".join(SPOTIFY_SCOPES),
-        "show_dialog": "true",  # Force user to reauthorize
-    }
-    
-    # Build authorization URL
-    param_string = "&".join([f"{k}={v}" for k, v in auth_params.items()])
-    auth_url = f"{SPOTIFY_AUTH_URL}?{param_string}"
+    auth_url = _build_authorize_url(
+        settings.SPOTIFY_CLIENT_ID, settings.SPOTIFY_REDIRECT_URI
+    )
     
     logger.debug(f"Redirecting to Spotify auth URL: {auth_url}")
     return RedirectResponse(auth_url)
@@ -133,6 +129,29 @@ def logout() -> RedirectResponse:
     return response
 
 
+@lru_cache(maxsize=8)
+def _build_authorize_url(client_id: str, redirect_uri: str) -> str:
+    """Build the URL-encoded Spotify authorization URL.
+    
+    All inputs are fixed per deployment, so the URL is only built once.
+    """
+    auth_params = {
+        "client_id": client_id,
+        "response_type": "code",
+        "redirect_uri": redirect_uri,
+        "scope": SPOTIFY_SCOPE,
+        "show_dialog": "true",  # Force user to reauthorize
+    }
+    return f"{SPOTIFY_AUTH_URL}?{urlencode(auth_params)}"
+
+
+@lru_cache(maxsize=8)
+def _build_basic_auth_header(client_id: str, client_secret: str) -> str:
+    """Build the HTTP Basic client credentials header for the token endpoint."""
+    credentials = f"{client_id}:{client_secret}".encode()
+    return f"Basic {base64.b64encode(credentials).decode()}"
+
+
 async def _exchange_code_for_tokens(
     code: str, 
     settings: Settings, 
@@ -144,8 +163,13 @@ async def _exchange_code_for_tokens(
         "grant_type": "authorization_code",
         "code": code,
         "redirect_uri": settings.SPOTIFY_REDIRECT_URI,
-        "client_id": settings.SPOTIFY_CLIENT_ID,
-        "client_secret": settings.SPOTIFY_CLIENT_SECRET,
+    }
+    
+    headers = {
+        "Authorization": _build_basic_auth_header(
+            settings.SPOTIFY_CLIENT_ID, settings.SPOTIFY_CLIENT_SECRET
+        ),
+        "Content-Type": "application/x-www-form-urlencoded",
     }
     
     try:
@@ -153,11 +177,11 @@ async def _exchange_code_for_tokens(
         response = await client.post(
             SPOTIFY_TOKEN_URL, 
             data=token_request_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
+            headers=headers
         )
         response.raise_for_status()
         
-        token_data = response.json()
+        token_data = orjson.loads(response.content)
         logger.info("Successfully obtained tokens from Spotify")
         return token_data
         
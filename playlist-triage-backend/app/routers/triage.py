@@ -1,8 +1,11 @@
 """Triage router with improved structure and dependency injection."""
 
+import asyncio
 from typing import List
 
 import httpx
+import numpy as np
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.core.dependencies import get_current_user_token, get_http_client, get_spotify_service
@@ -14,6 +17,25 @@ from app.services.spotify_service import SpotifyService
 
 logger = get_logger(__name__)
 
+# Track tags: (feature, tag) fire when sign * (value - threshold) > 0, so a
+# negative sign marks a "below threshold" tag. Order matches the tag output.
+_TRACK_TAG_FEATURES = (
+    "energy", "energy", "danceability", "valence", "valence",
+    "acousticness", "instrumentalness",
+)
+_TRACK_TAG_NAMES = (
+    "High Energy", "Low Energy", "Very Danceable", "Positive Mood", "Melancholic",
+    "Acoustic", "Instrumental",
+)
+_TRACK_TAG_THRESHOLDS = np.array([0.7, 0.3, 0.7, 0.7, 0.3, 0.6, 0.5])
+_TRACK_TAG_SIGNS = np.array([1.0, -1.0, 1.0, 1.0, -1.0, 1.0, 1.0])
+
+# Playlist consistency tags fire when the feature's std is below the threshold;
+# the default std is used when a profile lacks the feature
+_CONSISTENCY_TAG_DEFAULTS = (("key", 1.0), ("tempo", 50.0))
+_CONSISTENCY_TAG_NAMES = ("Consistent Key", "Consistent Tempo")
+_CONSISTENCY_TAG_THRESHOLDS = np.array([1.0, 20.0])
+
 router = APIRouter(prefix="/triage", tags=["triage"])
 
 
@@ -32,29 +54,30 @@ async def next_song(
     logger.info("Processing triage request for next song")
     
     try:
-        # Get unassigned songs
-        logger.debug("Fetching unassigned tracks")
-        unassigned_tracks = await spotify_service.get_unassigned_saved_tracks(access_token)
+        # Only the first unassigned song is needed; stop paging after it
+        logger.debug("Fetching first unassigned track")
+        unassigned_tracks = spotify_service.iter_unassigned_saved_tracks(access_token)
+        try:
+            song = await anext(unassigned_tracks, None)
+        finally:
+            await unassigned_tracks.aclose()
         
-        if not unassigned_tracks:
+        if song is None:
             logger.info("No unassigned songs found")
             raise ResourceNotFoundException(
                 "No unassigned songs found",
                 {"message": "All your saved songs are already in playlists!"}
             )
         
-        # Get the first song to process
         # TODO: Implement user progress tracking to resume from where they left off
-        song = unassigned_tracks[0]
         logger.info(f"Processing song: {song.name} by {', '.join(a.name for a in song.artists)}")
         
-        # Get user's playlists
-        logger.debug("Fetching user playlists")
-        playlists = await _get_user_playlists(client, access_token)
-        
-        # Get audio features for the song
-        logger.debug(f"Fetching audio features for song: {song.id}")
-        track_features = await _get_track_audio_features(client, song.id, access_token)
+        # Get user's playlists and the song's audio features concurrently
+        logger.debug(f"Fetching user playlists and audio features for song: {song.id}")
+        playlists, track_features = await asyncio.gather(
+            _get_user_playlists(client, access_token),
+            _get_track_audio_features(client, song.id, access_token),
+        )
         
         # Generate suggestions
         suggestions = await _generate_playlist_suggestions(
@@ -67,7 +90,7 @@ async def next_song(
             song_to_sort=song,
             suggestions=suggestions
         )
-        
+    
     except (ResourceNotFoundException, SpotifyAPIException):
         # Re-raise known exceptions
         raise
@@ -92,11 +115,11 @@ async def _get_user_playlists(
         try:
             response = await client.get(url, headers=headers)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             playlists.extend(data.get("items", []))
             url = data.get("next")
-            
+        
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to fetch playlists: {e.response.status_code}")
             raise SpotifyAPIException(
@@ -119,8 +142,8 @@ async def _get_track_audio_features(
     try:
         response = await client.get(url, headers=headers)
         response.raise_for_status()
-        return response.json()
-        
+        return orjson.loads(response.content)
+    
     except httpx.HTTPStatusError as e:
         logger.error(f"Failed to fetch audio features for track {track_id}: {e.response.status_code}")
         raise SpotifyAPIException(
@@ -136,86 +159,70 @@ async def _generate_playlist_suggestions(
     access_token: str
 ) -> List[PlaylistSuggestion]:
     """Generate playlist suggestions based on audio feature matching."""
-    suggestions = []
-    
-    for playlist in playlists:
-        try:
-            # Get audio profile for this playlist
-            profile = await spotify_service.get_playlist_audio_profile(
-                playlist["id"], access_token
-            )
-            
-            if not profile:
-                logger.debug(f"Skipping playlist {playlist['name']} - insufficient tracks for profile")
-                continue
-            
-            # Calculate match score
-            score = spotify_service.calculate_weighted_distance(track_features, profile)
-            
-            # Generate descriptive tags based on features and profile
-            tags = _generate_matching_tags(track_features, profile)
-            
-            suggestions.append(
-                PlaylistSuggestion(
-                    playlist_id=playlist["id"],
-                    playlist_name=playlist["name"],
-                    match_score=score,
-                    matching_tags=tags,
-                )
-            )
-            
-        except Exception as e:
-            logger.warning(f"Failed to process playlist {playlist.get('name', 'unknown')}: {str(e)}")
+    # Build every playlist profile from one shared audio-features fetch
+    profiles = await spotify_service.get_playlist_audio_profiles(
+        playlists, access_token
+    )
+    
+    scorable = []
+    for playlist, profile in zip(playlists, profiles):
+        if not profile:
+            logger.debug(f"Skipping playlist {playlist['name']} - insufficient tracks for profile")
             continue
+        
+        scorable.append((playlist, profile))
     
-    # Sort by match score (highest first)
-    suggestions.sort(key=lambda s: s.match_score, reverse=True)
-    
-    return suggestions
-
-
-def _generate_matching_tags(track_features: dict, playlist_profile: dict) -> List[str]:
-    """Generate descriptive tags based on feature matching."""
-    tags = []
-    
-    # Energy-based tags
-    energy = track_features.get("energy", 0)
-    if energy > 0.7:
-        tags.append("High Energy")
-    elif energy < 0.3:
-        tags.append("Low Energy")
-    
-    # Danceability tags
-    danceability = track_features.get("danceability", 0)
-    if danceability > 0.7:
-        tags.append("Very Danceable")
-    
-    # Valence (mood) tags
-    valence = track_features.get("valence", 0)
-    if valence > 0.7:
-        tags.append("Positive Mood")
-    elif valence < 0.3:
-        tags.append("Melancholic")
-    
-    # Acousticness tags
-    acousticness = track_features.get("acousticness", 0)
-    if acousticness > 0.6:
-        tags.append("Acoustic")
-    
-    # Instrumentalness tags
-    instrumentalness = track_features.get("instrumentalness", 0)
-    if instrumentalness > 0.5:
-        tags.append("Instrumental")
+    if not scorable:
+        return []
     
-    # Consistency tags based on playlist profile
-    profile_stds = playlist_profile.get("stds", {})
+    # Score every playlist in a single vectorized pass
+    scores = spotify_service.calculate_match_scores(
+        track_features, [profile for _, profile in scorable]
+    )
     
-    # Check if playlist has consistent key
-    if profile_stds.get("key", 1) < 1:
-        tags.append("Consistent Key")
+    tags = _generate_matching_tags(track_features, [profile for _, profile in scorable])
     
-    # Check if playlist has consistent tempo
-    if profile_stds.get("tempo", 50) < 20:
-        tags.append("Consistent Tempo")
+    # Rank by match score (highest first), keeping playlist order on ties
+    suggestions = []
+    for index in np.argsort(-scores, kind="stable"):
+        playlist, profile = scorable[index]
+        suggestions.append(
+            PlaylistSuggestion(
+                playlist_id=playlist["id"],
+                playlist_name=playlist["name"],
+                match_score=float(scores[index]),
+                matching_tags=tags[index],
+            )
+        )
     
-    return tags
+    return suggestions
+
+
+def _generate_matching_tags(
+    track_features: dict, playlist_profiles: List[dict]
+) -> List[List[str]]:
+    """Generate descriptive tags for a track against each playlist profile."""
+    # Track tags depend only on the track, so they are computed once
+    track_values = np.array(
+        [track_features.get(k) or 0.0 for k in _TRACK_TAG_FEATURES], dtype=float
+    )
+    track_mask = _TRACK_TAG_SIGNS * (track_values - _TRACK_TAG_THRESHOLDS) > 0
+    track_tags = [tag for tag, hit in zip(_TRACK_TAG_NAMES, track_mask) if hit]
+    
+    # Consistency tags compare every playlist's stds in one pass
+    stds_matrix = np.array(
+        [
+            [
+                profile.get("stds", {}).get(k, default)
+                for k, default in _CONSISTENCY_TAG_DEFAULTS
+            ]
+            for profile in playlist_profiles
+        ],
+        dtype=float,
+    ).reshape(len(playlist_profiles), len(_CONSISTENCY_TAG_NAMES))
+    consistency_mask = stds_matrix < _CONSISTENCY_TAG_THRESHOLDS
+    
+    return [
+        track_tags + [tag for tag, hit in zip(_CONSISTENCY_TAG_NAMES, row) if hit]
+        for row in consistency_mask
+    ]
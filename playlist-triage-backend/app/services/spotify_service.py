@@ -1,39 +1,63 @@
 """Spotify API service with improved error handling and structure."""
 
+import asyncio
+import hashlib
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import httpx
 import numpy as np
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
+from app.core.cache import TTLCache
 from app.core.exceptions import SpotifyAPIException
 from app.core.logging import get_logger
-from app.schemas.spotify import Artist, AudioFeatures, PlaylistSimple, Track
+from app.schemas.spotify import AudioFeatures, PlaylistSimple, Track
 
 logger = get_logger(__name__)
 
+_TRACK_LIST_ADAPTER = TypeAdapter(List[Track])
+
 
 class SpotifyServiceInterface(ABC):
     """Abstract interface for Spotify service."""
     
     @abstractmethod
-    async def get_unassigned_saved_tracks(self, access_token: str) -> List[Track]:
-        """Get tracks that are saved but not in any playlist."""
+    def iter_unassigned_saved_tracks(
+        self, access_token: str
+    ) -> AsyncGenerator[Track, None]:
+        """Yield tracks that are saved but not in any playlist."""
         pass
     
     @abstractmethod
     async def get_playlist_audio_profile(
-        self, playlist_id: str, access_token: str
+        self, playlist_id: str, access_token: str, snapshot_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Get audio feature profile for a playlist."""
         pass
     
+    @abstractmethod
+    async def get_playlist_audio_profiles(
+        self, playlists: List[Dict[str, Any]], access_token: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get audio feature profiles for several playlists."""
+        pass
+    
     @abstractmethod
     def calculate_weighted_distance(
         self, track_features: Dict[str, float], playlist_profile: Dict[str, Any]
     ) -> float:
         """Calculate match score between track and playlist."""
         pass
+    
+    @abstractmethod
+    def calculate_match_scores(
+        self, track_features: Dict[str, float], playlist_profiles: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """Calculate match scores between a track and several playlists."""
+        pass
 
 
 class SpotifyService(SpotifyServiceInterface):
@@ -52,11 +76,52 @@ class SpotifyService(SpotifyServiceInterface):
         "tempo",
     ]
     MIN_TRACKS_FOR_PROFILE = 5
+    MIN_STD = 1e-6  # Floor for feature stds to avoid division by zero
+    # Audio features carry a few significant digits, so scoring runs in float32;
+    # profile statistics are still accumulated in float64
+    SCORE_DTYPE = np.float32
     MAX_BATCH_SIZE = 100
+    # Largest page sizes Spotify allows for library and playlist-track listings
+    MAX_LIBRARY_PAGE_SIZE = 50
+    MAX_PLAYLIST_TRACKS_PAGE_SIZE = 100
+    # Only request what is needed from playlist-track listings; total and limit
+    # let the remaining pages be fetched in parallel
+    PLAYLIST_TRACK_ID_FIELDS = "items(track(id)),next,total,limit"
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Shared across requests. Profiles are keyed by playlist snapshot_id, which
+    # changes whenever the playlist is edited; track audio features never change.
+    _profile_cache: TTLCache[Tuple[str, str], Dict[str, Any]] = TTLCache(
+        maxsize=1024, ttl_seconds=3600
+    )
+    _features_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+        maxsize=50_000, ttl_seconds=24 * 3600
+    )
+    
+    # Per-user exclusion sets (track IDs already in some playlist), keyed by
+    # a SHA-256 digest of the access token so live tokens are not kept in
+    # memory, and stored with their build time. Entries older than
+    # EXCLUSION_SET_REFRESH_SECONDS are served stale while a background task
+    # rebuilds them; tokens expire after an hour, so entries do too.
+    EXCLUSION_SET_REFRESH_SECONDS = 60.0
+    _exclusion_cache: TTLCache[str, Tuple[float, FrozenSet[str]]] = TTLCache(
+        maxsize=256, ttl_seconds=3600
+    )
+    # Strong references to in-flight refreshes, at most one per token
+    _exclusion_refreshes: Dict[str, "asyncio.Task[None]"] = {}
     
     def __init__(self, client: httpx.AsyncClient) -> None:
         """Initialize Spotify service with HTTP client."""
         self.client = client
+        # Bounds concurrent Spotify calls to stay within API rate limits
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+    
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop all cached playlist profiles, audio features and exclusion sets."""
+        cls._profile_cache.clear()
+        cls._features_cache.clear()
+        cls._exclusion_cache.clear()
     
     def _get_auth_headers(self, access_token: str) -> Dict[str, str]:
         """Get authorization headers for Spotify API."""
@@ -73,9 +138,12 @@ class SpotifyService(SpotifyServiceInterface):
         headers = self._get_auth_headers(access_token)
         
         try:
-            response = await self.client.request(method, url, headers=headers, **kwargs)
+            async with self._request_semaphore:
+                response = await self.client.request(
+                    method, url, headers=headers, **kwargs
+                )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"Spotify API error: {e.response.status_code} - {e.response.text}")
             raise SpotifyAPIException(
@@ -89,136 +157,422 @@ class SpotifyService(SpotifyServiceInterface):
                 {"url": url, "error": str(e)}
             )
     
-    async def _get_paginated_data(
+    async def _iter_pages(
         self, 
         initial_url: str, 
         access_token: str,
-        items_key: str = "items"
-    ) -> List[Dict[str, Any]]:
-        """Get all items from a paginated Spotify API endpoint."""
-        all_items = []
-        url = initial_url
+        items_key: str = "items",
+        params: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Yield each page of items from a paginated Spotify API endpoint.
+        
+        Query params are only sent with the first request; Spotify carries them
+        over into the ``next`` URLs it returns.
+        """
+        url: Optional[str] = initial_url
         
         while url:
-            data = await self._make_spotify_request(url, access_token)
-            items = data.get(items_key, [])
-            all_items.extend(items)
+            data = await self._make_spotify_request(url, access_token, params=params)
+            yield data.get(items_key, [])
             url = data.get("next")
-            
-            logger.debug(f"Retrieved {len(items)} items, total: {len(all_items)}")
+            params = None
+    
+    async def _get_paginated_data(
+        self, 
+        initial_url: str, 
+        access_token: str,
+        items_key: str = "items",
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all items from a paginated Spotify API endpoint.
         
+        When the first page reports ``total`` and ``limit``, every remaining page
+        is requested concurrently by offset; otherwise ``next`` links are
+        followed one page at a time.
+        """
+        first_page = await self._make_spotify_request(
+            initial_url, access_token, params=params
+        )
+        all_items: List[Dict[str, Any]] = list(first_page.get(items_key, []))
+        next_url = first_page.get("next")
+        total = first_page.get("total")
+        limit = first_page.get("limit")
+        
+        if not next_url:
+            return all_items
+        
+        if not total or not limit:
+            async for items in self._iter_pages(next_url, access_token, items_key):
+                all_items.extend(items)
+                logger.debug(f"Retrieved {len(items)} items, total: {len(all_items)}")
+            return all_items
+        
+        # Offsets of the remaining pages are known up front; the request
+        # semaphore bounds how many are in flight
+        pages = await asyncio.gather(
+            *(
+                self._make_spotify_request(
+                    initial_url,
+                    access_token,
+                    params={**(params or {}), "offset": offset, "limit": limit},
+                )
+                for offset in range(first_page.get("offset", 0) + limit, total, limit)
+            )
+        )
+        for page in pages:
+            all_items.extend(page.get(items_key, []))
+        
+        logger.debug(f"Retrieved {len(all_items)} items in {len(pages) + 1} pages")
         return all_items
     
-    async def get_unassigned_saved_tracks(self, access_token: str) -> List[Track]:
-        """Get tracks that are saved but not in any playlist."""
-        logger.info("Starting to fetch unassigned saved tracks")
+    async def _get_playlist_track_ids(
+        self, playlist_id: str, access_token: str
+    ) -> List[str]:
+        """Get the IDs of all tracks in a playlist, skipping local/unavailable ones."""
+        track_items = await self._get_paginated_data(
+            f"{self.SPOTIFY_API_BASE}/playlists/{playlist_id}/tracks",
+            access_token,
+            params={
+                "fields": self.PLAYLIST_TRACK_ID_FIELDS,
+                "limit": self.MAX_PLAYLIST_TRACKS_PAGE_SIZE,
+            },
+        )
         
-        # Fetch all playlists
+        track_ids = []
+        for item in track_items:
+            track = item.get("track")
+            if track and track.get("id"):
+                track_ids.append(track["id"])
+        return track_ids
+    
+    async def _get_assigned_track_ids(self, access_token: str) -> FrozenSet[str]:
+        """Get the IDs of all tracks that appear in any of the user's playlists."""
         logger.debug("Fetching user playlists")
         playlists = await self._get_paginated_data(
             f"{self.SPOTIFY_API_BASE}/me/playlists",
-            access_token
+            access_token,
+            params={"limit": self.MAX_LIBRARY_PAGE_SIZE},
         )
         
-        # Collect all track IDs from playlists
-        playlist_track_ids = set()
-        for playlist in playlists:
-            logger.debug(f"Fetching tracks for playlist: {playlist.get('name')}")
-            tracks_url = f"{self.SPOTIFY_API_BASE}/playlists/{playlist['id']}/tracks"
-            track_items = await self._get_paginated_data(tracks_url, access_token)
-            
-            for item in track_items:
-                track = item.get("track")
-                if track and track.get("id"):
-                    playlist_track_ids.add(track["id"])
+        # Page through every playlist concurrently
+        track_id_lists = await asyncio.gather(
+            *(
+                self._get_playlist_track_ids(playlist["id"], access_token)
+                for playlist in playlists
+            )
+        )
+        
+        # The ID strings are already allocated by JSON parsing, so the set only
+        # adds references; build it in a single C-level union
+        playlist_track_ids = frozenset().union(*track_id_lists)
         
         logger.info(f"Found {len(playlist_track_ids)} tracks across {len(playlists)} playlists")
+        return playlist_track_ids
+    
+    @staticmethod
+    def _exclusion_cache_key(access_token: str) -> str:
+        """Key exclusion-set state by a digest rather than the raw token."""
+        return hashlib.sha256(access_token.encode()).hexdigest()
+    
+    async def _build_exclusion_set(
+        self, access_token: str, cache_key: str
+    ) -> FrozenSet[str]:
+        """Rebuild and cache the set of track IDs already in the user's playlists."""
+        playlist_track_ids = await self._get_assigned_track_ids(access_token)
+        self._exclusion_cache.set(cache_key, (time.monotonic(), playlist_track_ids))
+        return playlist_track_ids
+    
+    async def _refresh_exclusion_set(self, access_token: str, cache_key: str) -> None:
+        """Rebuild a cached exclusion set in the background."""
+        try:
+            await self._build_exclusion_set(access_token, cache_key)
+        except Exception as e:
+            logger.warning(f"Background exclusion set refresh failed: {str(e)}")
+        finally:
+            self._exclusion_refreshes.pop(cache_key, None)
+    
+    async def _get_exclusion_set(self, access_token: str) -> FrozenSet[str]:
+        """Get the track IDs already in the user's playlists.
         
-        # Fetch all saved tracks
-        logger.debug("Fetching saved tracks")
-        saved_track_items = await self._get_paginated_data(
+        Only the first request for a user waits for the playlists to be walked;
+        after that the cached set is returned immediately and refreshed in the
+        background once it is older than EXCLUSION_SET_REFRESH_SECONDS.
+        """
+        cache_key = self._exclusion_cache_key(access_token)
+        entry = self._exclusion_cache.get(cache_key)
+        if entry is None:
+            return await self._build_exclusion_set(access_token, cache_key)
+        
+        built_at, playlist_track_ids = entry
+        if (
+            time.monotonic() - built_at > self.EXCLUSION_SET_REFRESH_SECONDS
+            and cache_key not in self._exclusion_refreshes
+        ):
+            logger.debug("Serving stale exclusion set while refreshing")
+            self._exclusion_refreshes[cache_key] = asyncio.create_task(
+                self._refresh_exclusion_set(access_token, cache_key)
+            )
+        return playlist_track_ids
+    
+    def _validate_tracks(self, raw_tracks: List[Dict[str, Any]]) -> List[Track]:
+        """Validate Spotify track objects into Track models, skipping bad ones."""
+        try:
+            # Validate the whole batch in a single pydantic-core call
+            return _TRACK_LIST_ADAPTER.validate_python(raw_tracks)
+        except ValidationError:
+            pass
+        
+        # Some track is malformed; fall back to per-track validation
+        tracks = []
+        for raw_track in raw_tracks:
+            try:
+                tracks.append(Track.model_validate(raw_track))
+            except ValidationError as e:
+                logger.warning(f"Failed to parse track {raw_track.get('id')}: {str(e)}")
+        return tracks
+    
+    async def iter_unassigned_saved_tracks(
+        self, access_token: str
+    ) -> AsyncGenerator[Track, None]:
+        """Yield tracks that are saved but not in any playlist.
+        
+        Saved tracks are paged lazily, so a caller that stops after the first
+        track never fetches the rest of the library.
+        """
+        logger.info("Starting to fetch unassigned saved tracks")
+        
+        # The exclusion set is needed to filter the first page; fetch it while
+        # that page is being fetched
+        assigned_task = asyncio.create_task(self._get_exclusion_set(access_token))
+        saved_pages = self._iter_pages(
             f"{self.SPOTIFY_API_BASE}/me/tracks",
-            access_token
+            access_token,
+            params={"limit": self.MAX_LIBRARY_PAGE_SIZE},
         )
         
-        # Filter out tracks already in playlists
-        unassigned_tracks = []
-        for item in saved_track_items:
-            track = item.get("track")
-            if track and track.get("id") and track["id"] not in playlist_track_ids:
-                try:
-                    artists = [
-                        Artist(id=a["id"], name=a["name"]) 
-                        for a in track.get("artists", [])
-                    ]
-                    unassigned_tracks.append(
-                        Track(
-                            id=track["id"],
-                            name=track["name"],
-                            uri=track["uri"],
-                            artists=artists,
-                        )
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to parse track {track.get('id')}: {str(e)}")
-                    continue
+        try:
+            async for saved_track_items in saved_pages:
+                playlist_track_ids = await assigned_task
+                
+                # Filter out tracks already in playlists
+                raw_tracks = [
+                    track
+                    for item in saved_track_items
+                    if (track := item.get("track"))
+                    and track.get("id")
+                    and track["id"] not in playlist_track_ids
+                ]
+                for track in self._validate_tracks(raw_tracks):
+                    yield track
+        finally:
+            # Await the cancelled task so a failed exclusion fetch is retrieved
+            # rather than logged as "Task exception was never retrieved"
+            assigned_task.cancel()
+            await asyncio.gather(assigned_task, return_exceptions=True)
+            await saved_pages.aclose()
+    
+    async def _get_audio_features(
+        self, track_ids: List[str], access_token: str
+    ) -> Tuple[Dict[str, Dict[str, Any]], Set[str]]:
+        """Get audio features keyed by track ID, fetching uncached ones in batches.
+        
+        Also returns the IDs whose batch failed, so callers can tell a track
+        without features from one whose features could not be fetched.
+        """
+        # Use cached audio features where possible
+        features_by_id: Dict[str, Dict[str, Any]] = {}
+        missing_ids = []
+        for track_id in dict.fromkeys(track_ids):
+            cached_features = self._features_cache.get(track_id)
+            if cached_features is None:
+                missing_ids.append(track_id)
+            else:
+                features_by_id[track_id] = cached_features
+        
+        # Fetch remaining audio features, all batches concurrently. A failed
+        # batch only costs the profiles built from its tracks.
+        features_url = f"{self.SPOTIFY_API_BASE}/audio-features"
+        batches = [
+            missing_ids[i:i + self.MAX_BATCH_SIZE]
+            for i in range(0, len(missing_ids), self.MAX_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._make_spotify_request(
+                    features_url, access_token, params={"ids": ",".join(batch)}
+                )
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
+        
+        failures: List[SpotifyAPIException] = []
+        failed_ids: Set[str] = set()
+        for batch, response_data in zip(batches, responses):
+            if isinstance(response_data, SpotifyAPIException):
+                logger.warning(
+                    f"Failed to fetch audio features batch: {str(response_data)}"
+                )
+                failures.append(response_data)
+                failed_ids.update(batch)
+                continue
+            if isinstance(response_data, BaseException):
+                raise response_data
+            for features in response_data.get("audio_features", []):
+                if features is not None and features.get("id"):
+                    self._features_cache.set(features["id"], features)
+                    features_by_id[features["id"]] = features
+        
+        # Only fail outright when no features arrived at all
+        if failures and not features_by_id:
+            raise failures[0]
         
-        logger.info(f"Found {len(unassigned_tracks)} unassigned tracks")
-        return unassigned_tracks
+        return features_by_id, failed_ids
     
     async def get_playlist_audio_profile(
-        self, playlist_id: str, access_token: str
+        self, playlist_id: str, access_token: str, snapshot_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
-        """Get audio feature profile for a playlist."""
-        logger.debug(f"Getting audio profile for playlist: {playlist_id}")
+        """Get audio feature profile for a playlist.
         
-        # Fetch all tracks in playlist
-        tracks_url = f"{self.SPOTIFY_API_BASE}/playlists/{playlist_id}/tracks"
-        track_items = await self._get_paginated_data(tracks_url, access_token)
+        When a snapshot_id is given the profile is cached until the playlist
+        changes.
+        """
+        profiles = await self.get_playlist_audio_profiles(
+            [{"id": playlist_id, "snapshot_id": snapshot_id}], access_token
+        )
+        return profiles[0]
+    
+    async def get_playlist_audio_profiles(
+        self, playlists: List[Dict[str, Any]], access_token: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get audio feature profiles for several playlists, in input order.
         
-        track_ids = []
-        for item in track_items:
-            track = item.get("track")
-            if track and track.get("id"):
-                track_ids.append(track["id"])
+        Audio features are fetched once for the union of tracks across all
+        playlists, so songs shared between playlists are only requested once.
+        Playlists that fail to load or are too small get None.
+        """
+        profiles: List[Optional[Dict[str, Any]]] = [None] * len(playlists)
         
-        if len(track_ids) < self.MIN_TRACKS_FOR_PROFILE:
-            logger.warning(
-                f"Playlist {playlist_id} has only {len(track_ids)} tracks, "
-                f"need at least {self.MIN_TRACKS_FOR_PROFILE} for profile"
-            )
-            return None
+        # Serve unchanged playlists from the profile cache
+        pending = []
+        for index, playlist in enumerate(playlists):
+            snapshot_id = playlist.get("snapshot_id")
+            cache_key = (playlist["id"], snapshot_id) if snapshot_id else None
+            if cache_key is not None:
+                cached_profile = self._profile_cache.get(cache_key)
+                if cached_profile is not None:
+                    logger.debug(
+                        f"Using cached audio profile for playlist: {playlist['id']}"
+                    )
+                    profiles[index] = cached_profile
+                    continue
+            pending.append((index, playlist["id"], cache_key))
         
-        # Fetch audio features in batches
-        features_data = []
-        for i in range(0, len(track_ids), self.MAX_BATCH_SIZE):
-            batch_ids = track_ids[i:i + self.MAX_BATCH_SIZE]
-            features_url = f"{self.SPOTIFY_API_BASE}/audio-features"
-            params = {"ids": ",".join(batch_ids)}
-            
-            response_data = await self._make_spotify_request(
-                features_url, access_token, params=params
+        if not pending:
+            return profiles
+        
+        # Fetch all track listings concurrently
+        track_id_lists = await asyncio.gather(
+            *(
+                self._get_playlist_track_ids(playlist_id, access_token)
+                for _, playlist_id, _ in pending
+            ),
+            return_exceptions=True,
+        )
+        
+        to_build = []
+        for (index, playlist_id, cache_key), track_ids in zip(pending, track_id_lists):
+            if isinstance(track_ids, BaseException):
+                logger.warning(
+                    f"Failed to fetch tracks for playlist {playlist_id}: "
+                    f"{str(track_ids)}"
+                )
+                continue
+            if len(track_ids) < self.MIN_TRACKS_FOR_PROFILE:
+                logger.warning(
+                    f"Playlist {playlist_id} has only {len(track_ids)} tracks, "
+                    f"need at least {self.MIN_TRACKS_FOR_PROFILE} for profile"
+                )
+                continue
+            to_build.append((index, playlist_id, cache_key, track_ids))
+        
+        if not to_build:
+            return profiles
+        
+        # One batched fetch for every unique track across the playlists
+        unique_ids = list(
+            dict.fromkeys(
+                track_id for *_, track_ids in to_build for track_id in track_ids
             )
-            batch_features = response_data.get("audio_features", [])
-            features_data.extend([f for f in batch_features if f is not None])
+        )
+        features_by_id, failed_ids = await self._get_audio_features(
+            unique_ids, access_token
+        )
+        
+        for index, playlist_id, cache_key, track_ids in to_build:
+            # A profile from a partial fetch would be skewed and then cached
+            # for the playlist's snapshot, so skip it until the next request
+            if failed_ids.intersection(track_ids):
+                logger.warning(
+                    f"Skipping profile for playlist {playlist_id}: "
+                    "some audio features could not be fetched"
+                )
+                continue
+            profile = self._build_profile(playlist_id, track_ids, features_by_id)
+            if profile is not None and cache_key is not None:
+                self._profile_cache.set(cache_key, profile)
+            profiles[index] = profile
+        
+        return profiles
+    
+    def _build_profile(
+        self,
+        playlist_id: str,
+        track_ids: List[str],
+        features_by_id: Dict[str, Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """Compute a playlist's feature means and stds from prefetched features."""
+        features_data = [
+            features_by_id[track_id]
+            for track_id in track_ids
+            if track_id in features_by_id
+        ]
         
-        if not features_data:
-            logger.warning(f"No audio features found for playlist {playlist_id}")
+        if len(features_data) < self.MIN_TRACKS_FOR_PROFILE:
+            logger.warning(
+                f"Playlist {playlist_id} has audio features for only "
+                f"{len(features_data)} tracks, need at least "
+                f"{self.MIN_TRACKS_FOR_PROFILE} for profile"
+            )
             return None
         
         # Calculate statistics
         try:
-            feature_matrix = np.array([
-                [f.get(k, 0.0) for k in self.FEATURE_KEYS] 
-                for f in features_data
-            ])
+            # Fill a preallocated (tracks x features) buffer straight from the
+            # feature dicts, without an intermediate list of lists
+            count = len(features_data)
+            n_features = len(self.FEATURE_KEYS)
+            feature_matrix = np.fromiter(
+                (f.get(k, 0.0) for f in features_data for k in self.FEATURE_KEYS),
+                dtype=np.float64,
+                count=count * n_features,
+            ).reshape(count, n_features)
             
-            means = dict(zip(self.FEATURE_KEYS, np.mean(feature_matrix, axis=0)))
-            stds = dict(zip(self.FEATURE_KEYS, np.std(feature_matrix, axis=0)))
+            means_vec = feature_matrix.mean(axis=0)
+            stds_vec = feature_matrix.std(axis=0)
             
             logger.debug(f"Calculated profile for {len(features_data)} tracks")
-            return {"means": means, "stds": stds, "track_count": len(features_data)}
-            
+            return {
+                "means": dict(zip(self.FEATURE_KEYS, means_vec)),
+                "stds": dict(zip(self.FEATURE_KEYS, stds_vec)),
+                "track_count": len(features_data),
+                # Vector forms ordered by FEATURE_KEYS for fast scoring
+                "means_vec": means_vec.astype(self.SCORE_DTYPE),
+                "inv_stds_vec": (1.0 / np.maximum(stds_vec, self.MIN_STD)).astype(
+                    self.SCORE_DTYPE
+                ),
+            }
+        
         except Exception as e:
             logger.error(f"Error calculating audio profile: {str(e)}")
             return None
@@ -227,22 +581,36 @@ class SpotifyService(SpotifyServiceInterface):
         self, track_features: Dict[str, float], playlist_profile: Dict[str, Any]
     ) -> float:
         """Calculate weighted distance between track and playlist profile."""
-        means = playlist_profile["means"]
-        stds = playlist_profile["stds"]
-        
-        distance = 0.0
-        for feature_key in self.FEATURE_KEYS:
-            std = stds.get(feature_key, 1e-6)
-            # Avoid division by zero and use meaningful weight
-            weight = 1.0 / max(std, 1e-6)
-            
-            track_value = track_features.get(feature_key, 0.0)
-            mean_value = means.get(feature_key, 0.0)
-            
-            diff = track_value - mean_value
-            distance += weight * (diff ** 2)
+        track_vec = self._feature_vector(track_features)
+        
+        # Inverse-variance weighted squared distance; tight features count more
+        diff = track_vec - playlist_profile["means_vec"]
+        distance = float(np.dot(playlist_profile["inv_stds_vec"], diff * diff))
         
-        # Normalize to 0-100 scale (higher is better match)
-        # Use exponential decay to convert distance to score
-        score = 100.0 * np.exp(-distance / 10.0)
-        return float(np.clip(score, 0.0, 100.0))
+        # Normalize to 0-100 scale (higher is better match). The distance is
+        # non-negative, so this rational decay stays in (0, 100] without
+        # clipping and ranks playlists exactly as exp(-d/10) would.
+        return 100.0 / (1.0 + distance / 10.0)
+    
+    def calculate_match_scores(
+        self, track_features: Dict[str, float], playlist_profiles: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """Calculate match scores for a track against many playlist profiles at once.
+        
+        Equivalent to calling calculate_weighted_distance per profile, but scores
+        all playlists with a single matrix operation.
+        """
+        track_vec = self._feature_vector(track_features)
+        means_mat = np.stack([p["means_vec"] for p in playlist_profiles])
+        inv_stds_mat = np.stack([p["inv_stds_vec"] for p in playlist_profiles])
+        
+        diff = track_vec[np.newaxis, :] - means_mat
+        distances: np.ndarray = np.einsum("ij,ij->i", inv_stds_mat, diff * diff)
+        
+        return 100.0 / (1.0 + distances / 10.0)
+    
+    def _feature_vector(self, features: Dict[str, float]) -> np.ndarray:
+        """Convert an audio features object into a vector ordered by FEATURE_KEYS."""
+        return np.array(
+            [features.get(k, 0.0) for k in self.FEATURE_KEYS], dtype=self.SCORE_DTYPE
+        )
@@ -0,0 +1 @@
+"""Command-line tools for building and maintaining the application."""
@@ -0,0 +1,38 @@
+"""Write the application's OpenAPI schema to a JSON file.
+
+Run at build time so non-development deployments can serve a prebuilt
+schema instead of introspecting every route on first request::
+
+    python -m app.tools.dump_openapi [output_path]
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import orjson
+from fastapi import FastAPI
+
+from app.core.config import settings
+from app.main import app
+
+
+def dump_openapi(output_path: Path) -> None:
+    """Generate the OpenAPI schema and write it to the given path."""
+    # A prebuilt schema may have been loaded at import, replacing app.openapi;
+    # call FastAPI's own generator so the schema is rebuilt from the routes
+    app.openapi_schema = None
+    schema = FastAPI.openapi(app)
+    output_path.write_bytes(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for ``python -m app.tools.dump_openapi``."""
+    args = sys.argv[1:] if argv is None else argv
+    output_path = Path(args[0] if args else settings.OPENAPI_SCHEMA_PATH)
+    dump_openapi(output_path)
+    print(f"Wrote OpenAPI schema to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
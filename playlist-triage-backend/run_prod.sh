@@ -8,6 +8,8 @@ uvicorn app.main:app \
     --host 0.0.0.0 \
     --port 8000 \
     --workers 4 \
+    --loop uvloop \
+    --http httptools \
     --log-level info \
     --access-log \
     --no-server-header
\ No newline at end of file
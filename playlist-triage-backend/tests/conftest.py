@@ -1,18 +1,58 @@
 """Test configuration and fixtures."""
 
+from typing import AsyncIterator, Callable
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.dependencies import get_http_client
 from app.main import app
+from app.routers import health
+from app.services.spotify_service import SpotifyService
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create test client."""
-    return TestClient(app)
+    """Create a test client shared by every test in a module.
+    
+    The app lifespan is entered once per module rather than once per test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def reset_state(request: pytest.FixtureRequest):
+    """Clear per-process caches and client state left over from the last test."""
+    yield
+    SpotifyService.clear_caches()
+    health._spotify_check_cache = None
+    app.dependency_overrides.clear()
+    if "client" in request.fixturenames:
+        request.getfixturevalue("client").cookies.clear()
+
+
+@pytest.fixture
+def mock_http_client():
+    """Route the app's outbound HTTP calls to a request handler.
+    
+    Call the returned function with an httpx.MockTransport handler. Each app
+    request gets its own client, closed when the request finishes; reset_state
+    removes the override after the test.
+    """
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> None:
+        async def override() -> AsyncIterator[httpx.AsyncClient]:
+            transport = httpx.MockTransport(handler)
+            async with httpx.AsyncClient(transport=transport) as http_client:
+                yield http_client
+        
+        app.dependency_overrides[get_http_client] = override
+    
+    return install
 
 
 @pytest.fixture
 def mock_access_token():
     """Mock access token for testing."""
-    return "mock_access_token_for_testing"
\ No newline at end of file
+    return "mock_access_token_for_testing"
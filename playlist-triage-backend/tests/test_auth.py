@@ -0,0 +1,65 @@
+"""Tests for authentication endpoints."""
+
+import base64
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+
+
+def test_login_redirects_to_spotify(client: TestClient):
+    """Test login redirect carries URL-encoded OAuth parameters."""
+    response = client.get("/auth/login", follow_redirects=False)
+    
+    assert response.status_code == 307
+    location = urlsplit(response.headers["location"])
+    params = parse_qs(location.query)
+    
+    settings = get_settings()
+    assert location.netloc == "accounts.spotify.com"
+    assert params["client_id"] == [settings.SPOTIFY_CLIENT_ID]
+    assert params["redirect_uri"] == [settings.SPOTIFY_REDIRECT_URI]
+    assert params["response_type"] == ["code"]
+    assert "playlist-read-private" in params["scope"][0].split(" ")
+
+
+def test_callback_uses_basic_auth_for_token_exchange(
+    client: TestClient, mock_http_client
+):
+    """Test token exchange sends client credentials via HTTP Basic auth."""
+    captured = {}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["request"] = request
+        return httpx.Response(
+            200, json={"access_token": "token", "expires_in": 3600}
+        )
+    
+    mock_http_client(handler)
+    response = client.get(
+        "/auth/callback", params={"code": "abc"}, follow_redirects=False
+    )
+    
+    assert response.status_code == 302
+    assert response.cookies["access_token"] == "token"
+    
+    settings = get_settings()
+    request = captured["request"]
+    credentials = f"{settings.SPOTIFY_CLIENT_ID}:{settings.SPOTIFY_CLIENT_SECRET}"
+    expected = "Basic " + base64.b64encode(credentials.encode()).decode()
+    assert request.headers["Authorization"] == expected
+    
+    form = parse_qs(request.content.decode())
+    assert form["code"] == ["abc"]
+    assert "client_secret" not in form
+
+
+def test_protected_endpoint_requires_token(client: TestClient):
+    """Test protected endpoints reject requests without an access token."""
+    response = client.get("/triage/next")
+    assert response.status_code == 401
+    
+    response = client.get("/triage/next", headers={"Authorization": "Basic abc"})
+    assert response.status_code == 401
@@ -68,4 +68,34 @@ def test_debug_field_conversion():
         APP_SECRET_KEY="test", 
         DEBUG="false"
     )
-    assert settings.DEBUG is False
\ No newline at end of file
+    assert settings.DEBUG is False
+
+
+def test_get_settings_is_cached():
+    """Test settings are only constructed once per process."""
+    assert get_settings() is get_settings()
+
+
+def test_middleware_flag_defaults():
+    """Test CORS is enabled and host checking is open by default."""
+    settings = Settings(
+        SPOTIFY_CLIENT_ID="test",
+        SPOTIFY_CLIENT_SECRET="test",
+        APP_SECRET_KEY="test",
+    )
+    assert settings.ENABLE_CORS is True
+    assert settings.ALLOWED_HOSTS == ["*"]
+
+
+def test_api_docs_enabled():
+    """Test API docs are served in development or when explicitly enabled."""
+    base = dict(
+        SPOTIFY_CLIENT_ID="test",
+        SPOTIFY_CLIENT_SECRET="test",
+        APP_SECRET_KEY="test",
+    )
+    assert Settings(**base, ENVIRONMENT="development").api_docs_enabled() is True
+    assert Settings(**base, ENVIRONMENT="production").api_docs_enabled() is False
+    assert Settings(
+        **base, ENVIRONMENT="production", ENABLE_API_DOCS=True
+    ).api_docs_enabled() is True
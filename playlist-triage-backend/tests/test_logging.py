@@ -0,0 +1,18 @@
+"""Tests for logging configuration."""
+
+import logging
+
+from app.core import logging as app_logging
+
+
+def test_setup_logging_is_idempotent():
+    """Test a second setup call keeps the running listener and root handlers."""
+    app_logging.setup_logging()
+    listener = app_logging._queue_listener
+    handlers = list(logging.getLogger().handlers)
+    
+    app_logging.setup_logging()
+    
+    assert listener is not None
+    assert app_logging._queue_listener is listener
+    assert logging.getLogger().handlers == handlers
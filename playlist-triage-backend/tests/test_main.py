@@ -0,0 +1,36 @@
+"""Tests for application setup."""
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import load_prebuilt_openapi_schema
+
+PREBUILT_SCHEMA = {
+    "openapi": "3.1.0",
+    "info": {"title": "Prebuilt", "version": "1.0.0"},
+    "paths": {},
+}
+
+
+def test_prebuilt_openapi_schema_is_served(tmp_path):
+    """Test /openapi.json returns the prebuilt schema file's contents."""
+    schema_file = tmp_path / "openapi.json"
+    schema_file.write_bytes(orjson.dumps(PREBUILT_SCHEMA))
+    app = FastAPI(openapi_url="/openapi.json")
+
+    assert load_prebuilt_openapi_schema(app, schema_file) is True
+
+    response = TestClient(app).get("/openapi.json")
+    assert response.status_code == 200
+    assert response.json() == PREBUILT_SCHEMA
+
+
+def test_prebuilt_openapi_schema_skipped_when_not_served(tmp_path):
+    """Test the schema file is not loaded when /openapi.json is disabled."""
+    schema_file = tmp_path / "openapi.json"
+    schema_file.write_bytes(orjson.dumps(PREBUILT_SCHEMA))
+    app = FastAPI(openapi_url=None)
+
+    assert load_prebuilt_openapi_schema(app, schema_file) is False
+    assert app.openapi()["info"]["title"] == "FastAPI"
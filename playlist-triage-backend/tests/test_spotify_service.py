@@ -0,0 +1,139 @@
+"""Tests for Spotify service helpers."""
+
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+
+from app.core.exceptions import SpotifyAPIException
+from app.services.spotify_service import SpotifyService
+
+
+@pytest.fixture
+def service():
+    """Create a Spotify service that never touches the network."""
+    return SpotifyService(httpx.AsyncClient(transport=httpx.MockTransport(None)))
+
+
+def _profile(service: SpotifyService, means: np.ndarray, stds: np.ndarray) -> dict:
+    """Build a playlist profile in the shape produced by the service."""
+    return {
+        "means": dict(zip(service.FEATURE_KEYS, means)),
+        "stds": dict(zip(service.FEATURE_KEYS, stds)),
+        "means_vec": means,
+        "inv_stds_vec": 1.0 / np.maximum(stds, service.MIN_STD),
+    }
+
+
+def test_batch_scores_match_single_scores(service: SpotifyService):
+    """Test batched scoring agrees with scoring each playlist separately."""
+    rng = np.random.default_rng(0)
+    n_features = len(service.FEATURE_KEYS)
+    profiles = [
+        _profile(service, rng.random(n_features), rng.random(n_features) / 2)
+        for _ in range(5)
+    ]
+    track_features = dict(zip(service.FEATURE_KEYS, rng.random(n_features)))
+    
+    scores = service.calculate_match_scores(track_features, profiles)
+    
+    expected = [
+        service.calculate_weighted_distance(track_features, profile)
+        for profile in profiles
+    ]
+    np.testing.assert_allclose(scores, expected)
+
+
+def test_validate_tracks_skips_malformed_tracks(service: SpotifyService):
+    """Test one malformed track does not drop the rest of the batch."""
+    good = {
+        "id": "t1",
+        "name": "Song",
+        "uri": "spotify:track:t1",
+        "artists": [{"id": "a1", "name": "Artist", "type": "artist"}],
+    }
+    bad = {"id": "t2", "name": "Broken", "artists": []}
+    
+    tracks = service._validate_tracks([good, bad])
+    
+    assert [track.id for track in tracks] == ["t1"]
+    assert tracks[0].artists[0].name == "Artist"
+
+
+def test_build_profile_requires_min_tracks_with_features(service: SpotifyService):
+    """Test a profile is not built from fewer tracks than MIN_TRACKS_FOR_PROFILE."""
+    track_ids = [f"t{i}" for i in range(service.MIN_TRACKS_FOR_PROFILE)]
+    features_by_id = {
+        track_id: dict.fromkeys(service.FEATURE_KEYS, 0.5) for track_id in track_ids
+    }
+    
+    assert service._build_profile("p", track_ids, features_by_id) is not None
+    
+    del features_by_id[track_ids[0]]
+    assert service._build_profile("p", track_ids, features_by_id) is None
+
+
+async def test_exclusion_set_served_stale_while_refreshing(
+    service: SpotifyService, monkeypatch: pytest.MonkeyPatch
+):
+    """Test an aged exclusion set is returned at once and rebuilt in the background."""
+    SpotifyService.clear_caches()
+    versions = iter([frozenset({"t1"}), frozenset({"t1", "t2"})])
+    
+    async def fake_assigned_track_ids(access_token: str):
+        return next(versions)
+    
+    monkeypatch.setattr(service, "_get_assigned_track_ids", fake_assigned_track_ids)
+    
+    assert await service._get_exclusion_set("token") == {"t1"}
+    
+    monkeypatch.setattr(service, "EXCLUSION_SET_REFRESH_SECONDS", -1.0)
+    assert await service._get_exclusion_set("token") == {"t1"}
+    await SpotifyService._exclusion_refreshes[service._exclusion_cache_key("token")]
+    
+    monkeypatch.setattr(service, "EXCLUSION_SET_REFRESH_SECONDS", 60.0)
+    assert await service._get_exclusion_set("token") == {"t1", "t2"}
+    SpotifyService.clear_caches()
+
+
+async def test_exclusion_set_not_keyed_by_raw_token(
+    service: SpotifyService, monkeypatch: pytest.MonkeyPatch
+):
+    """Test cached exclusion sets do not keep the access token in memory."""
+    async def fake_assigned_track_ids(access_token: str):
+        return frozenset({"t1"})
+    
+    monkeypatch.setattr(service, "_get_assigned_track_ids", fake_assigned_track_ids)
+    
+    await service._get_exclusion_set("secret-token")
+    
+    assert service._exclusion_cache.get("secret-token") is None
+    assert service._exclusion_cache.get(service._exclusion_cache_key("secret-token"))
+
+
+async def test_exclusion_task_finished_when_paging_fails(
+    service: SpotifyService, monkeypatch: pytest.MonkeyPatch
+):
+    """Test the exclusion-set task is cancelled and awaited, not left running."""
+    events = []
+    
+    async def slow_exclusion_set(access_token: str):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+    
+    async def failing_pages(*args, **kwargs):
+        await asyncio.sleep(0)
+        raise SpotifyAPIException("saved tracks failed")
+        yield []
+    
+    monkeypatch.setattr(service, "_get_exclusion_set", slow_exclusion_set)
+    monkeypatch.setattr(service, "_iter_pages", failing_pages)
+    
+    with pytest.raises(SpotifyAPIException, match="saved tracks failed"):
+        await anext(service.iter_unassigned_saved_tracks("token"))
+    
+    assert events == ["cancelled"]
@@ -0,0 +1,33 @@
+"""Tests for command-line tools."""
+
+import orjson
+
+from app.main import app, load_prebuilt_openapi_schema
+from app.tools.dump_openapi import main
+
+
+def test_dump_openapi_writes_schema(tmp_path):
+    """Test OpenAPI schema dump produces a loadable schema file."""
+    output_path = tmp_path / "openapi.json"
+    
+    main([str(output_path)])
+    
+    schema = orjson.loads(output_path.read_bytes())
+    assert "openapi" in schema
+    assert "/health/" in schema["paths"]
+
+
+def test_dump_openapi_ignores_loaded_prebuilt_schema(tmp_path, monkeypatch):
+    """Test the dump rebuilds from routes even when a stale schema is loaded."""
+    stale_path = tmp_path / "stale.json"
+    stale_path.write_bytes(orjson.dumps({"info": {"title": "STALE"}, "paths": {}}))
+    monkeypatch.setattr(app, "openapi_url", "/openapi.json")
+    monkeypatch.setattr(app, "openapi", app.openapi)
+    load_prebuilt_openapi_schema(app, stale_path)
+    output_path = tmp_path / "openapi.json"
+    
+    main([str(output_path)])
+    
+    schema = orjson.loads(output_path.read_bytes())
+    assert schema["info"]["title"] != "STALE"
+    assert "/health/" in schema["paths"]
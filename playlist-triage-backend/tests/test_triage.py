@@ -0,0 +1,308 @@
+"""Tests for the triage endpoint against a fake Spotify API."""
+
+from typing import Any, Dict, List, Set
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.routers.triage import _generate_matching_tags
+
+FEATURE_KEYS = [
+    "danceability",
+    "energy",
+    "key",
+    "valence",
+    "acousticness",
+    "instrumentalness",
+    "liveness",
+    "speechiness",
+    "tempo",
+]
+
+
+def _features(track_id: str, energy: float, offset: float) -> Dict[str, Any]:
+    """Build an audio-features object with a small per-track spread."""
+    features: Dict[str, Any] = {k: 0.5 + offset for k in FEATURE_KEYS}
+    features.update(id=track_id, energy=energy + offset, key=5, tempo=120.0 + offset)
+    return features
+
+
+def _track(track_id: str) -> Dict[str, Any]:
+    """Build a full Spotify track object."""
+    return {
+        "id": track_id,
+        "name": f"Song {track_id}",
+        "uri": f"spotify:track:{track_id}",
+        "artists": [{"id": f"artist-{track_id}", "name": f"Artist {track_id}"}],
+    }
+
+
+class FakeSpotify:
+    """In-memory Spotify Web API serving paginated playlists and features."""
+    
+    def __init__(self) -> None:
+        self.playlists = {
+            "loud": [f"loud{i}" for i in range(6)],
+            "quiet": [f"quiet{i}" for i in range(6)],
+            "tiny": ["tiny0"],
+        }
+        self.saved = ["loud0", "quiet1", "new-loud", "new-quiet"]
+        self.features = {}
+        for i, track_id in enumerate(self.playlists["loud"] + ["new-loud"]):
+            self.features[track_id] = _features(track_id, 0.9, i * 0.01)
+        for i, track_id in enumerate(self.playlists["quiet"] + ["new-quiet"]):
+            self.features[track_id] = _features(track_id, 0.1, i * 0.01)
+        self.features["tiny0"] = _features("tiny0", 0.5, 0.0)
+        # Audio-features batches containing any of these IDs fail with a 503
+        self.failing_feature_ids: Set[str] = set()
+        self.requests: List[httpx.Request] = []
+    
+    def _page(
+        self, request: httpx.Request, items: List[Any], max_limit: int
+    ) -> httpx.Response:
+        limit = min(int(request.url.params.get("limit", 20)), max_limit)
+        offset = int(request.url.params.get("offset", 0))
+        next_url = None
+        if offset + limit < len(items):
+            next_url = str(
+                request.url.copy_set_param("offset", offset + limit).copy_set_param(
+                    "limit", limit
+                )
+            )
+        return httpx.Response(
+            200,
+            json={
+                "items": items[offset:offset + limit],
+                "limit": limit,
+                "offset": offset,
+                "total": len(items),
+                "next": next_url,
+            },
+        )
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/v1/me/playlists":
+            items = [
+                {"id": pid, "name": pid.title(), "snapshot_id": f"{pid}-v1"}
+                for pid in self.playlists
+            ]
+            return self._page(request, items, 50)
+        if path.startswith("/v1/playlists/") and path.endswith("/tracks"):
+            playlist_id = path.split("/")[3]
+            items = [{"track": _track(t)} for t in self.playlists[playlist_id]]
+            return self._page(request, items, 100)
+        if path == "/v1/me/tracks":
+            return self._page(request, [{"track": _track(t)} for t in self.saved], 50)
+        if path == "/v1/audio-features":
+            ids = request.url.params["ids"].split(",")
+            assert len(ids) <= 100
+            if self.failing_feature_ids.intersection(ids):
+                return httpx.Response(503, json={"error": {"status": 503}})
+            return httpx.Response(
+                200, json={"audio_features": [self.features.get(i) for i in ids]}
+            )
+        if path.startswith("/v1/audio-features/"):
+            return httpx.Response(200, json=self.features[path.rsplit("/", 1)[1]])
+        return httpx.Response(404, json={"error": {"status": 404}})
+
+
+@pytest.fixture
+def fake_spotify(mock_http_client):
+    """Route the app's HTTP client to an in-memory fake Spotify API."""
+    spotify = FakeSpotify()
+    mock_http_client(spotify)
+    return spotify
+
+
+def test_next_song_ranks_matching_playlist_first(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test the first unassigned song is suggested for the closest playlist."""
+    response = client.get(
+        "/triage/next", headers={"Authorization": f"Bearer {mock_access_token}"}
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["song_to_sort"]["id"] == "new-loud"
+    
+    suggestions = data["suggestions"]
+    assert [s["playlist_id"] for s in suggestions] == ["loud", "quiet"]
+    assert suggestions[0]["match_score"] > suggestions[1]["match_score"]
+    assert "High Energy" in suggestions[0]["matching_tags"]
+    assert "Consistent Key" in suggestions[0]["matching_tags"]
+
+
+def test_next_song_without_unassigned_tracks(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test a 404 is returned when every saved song is already in a playlist."""
+    fake_spotify.saved = ["loud0", "quiet1"]
+    
+    response = client.get(
+        "/triage/next", headers={"Authorization": f"Bearer {mock_access_token}"}
+    )
+    
+    assert response.status_code == 404
+
+
+def test_playlist_profiles_are_cached_across_requests(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test unchanged playlists reuse their profile on the next request."""
+    headers = {"Authorization": f"Bearer {mock_access_token}"}
+    first = client.get("/triage/next", headers=headers)
+    
+    fake_spotify.requests.clear()
+    second = client.get("/triage/next", headers=headers)
+    
+    assert second.json() == first.json()
+    assert not [r for r in fake_spotify.requests if r.url.path == "/v1/audio-features"]
+
+
+def test_playlist_tracks_request_only_track_ids(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test playlist track listings ask Spotify for track IDs only."""
+    client.get("/triage/next", headers={"Authorization": f"Bearer {mock_access_token}"})
+    
+    track_requests = [
+        r for r in fake_spotify.requests
+        if r.url.path.startswith("/v1/playlists/")
+    ]
+    assert track_requests
+    for request in track_requests:
+        assert request.url.params["fields"].startswith("items(track(id))")
+
+
+def test_large_playlist_features_fetched_in_batches(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test playlists over 100 tracks have every track's features fetched."""
+    loud = [f"loud{i}" for i in range(150)]
+    fake_spotify.playlists["loud"] = loud
+    for i, track_id in enumerate(loud):
+        fake_spotify.features[track_id] = _features(track_id, 0.9, (i % 6) * 0.01)
+    
+    response = client.get(
+        "/triage/next", headers={"Authorization": f"Bearer {mock_access_token}"}
+    )
+    
+    assert response.status_code == 200
+    requested_ids = [
+        track_id
+        for r in fake_spotify.requests
+        if r.url.path == "/v1/audio-features"
+        for track_id in r.url.params["ids"].split(",")
+    ]
+    assert set(loud) <= set(requested_ids)
+
+
+def test_shared_tracks_features_fetched_once(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test a track found in several playlists has its features requested once."""
+    fake_spotify.playlists["quiet"] = fake_spotify.playlists["quiet"] + ["loud0"]
+    
+    client.get("/triage/next", headers={"Authorization": f"Bearer {mock_access_token}"})
+    
+    requested_ids = [
+        track_id
+        for r in fake_spotify.requests
+        if r.url.path == "/v1/audio-features"
+        for track_id in r.url.params["ids"].split(",")
+    ]
+    assert requested_ids.count("loud0") == 1
+    assert len(requested_ids) == len(set(requested_ids))
+
+
+def test_playlist_spanning_failed_features_batch_is_not_profiled(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test a playlist with tracks in a failed batch gets no cached profile."""
+    # loud spans two batches; quiet's tracks share the second, healthy one
+    loud = [f"loud{i}" for i in range(150)]
+    fake_spotify.playlists["loud"] = loud
+    for i, track_id in enumerate(loud):
+        fake_spotify.features[track_id] = _features(track_id, 0.9, (i % 6) * 0.01)
+    fake_spotify.failing_feature_ids = {"loud0"}
+    headers = {"Authorization": f"Bearer {mock_access_token}"}
+    
+    response = client.get("/triage/next", headers=headers)
+    
+    assert response.status_code == 200
+    suggestions = response.json()["suggestions"]
+    assert [s["playlist_id"] for s in suggestions] == ["quiet"]
+    
+    # Once Spotify recovers, loud is profiled from all of its tracks
+    fake_spotify.failing_feature_ids = set()
+    response = client.get("/triage/next", headers=headers)
+    
+    suggestions = response.json()["suggestions"]
+    assert [s["playlist_id"] for s in suggestions] == ["loud", "quiet"]
+
+
+def test_all_features_batches_failing_fails_request(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test the request fails when no audio features could be fetched."""
+    fake_spotify.failing_feature_ids = {"loud0", "quiet0"}
+    
+    response = client.get(
+        "/triage/next", headers={"Authorization": f"Bearer {mock_access_token}"}
+    )
+    
+    assert response.status_code == 502
+
+
+def test_matching_tags_per_playlist():
+    """Test track tags are shared and consistency tags follow each playlist."""
+    track_features = {"energy": 0.2, "valence": 0.9, "acousticness": 0.8}
+    profiles = [
+        {"stds": {"key": 0.5, "tempo": 5.0}},
+        {"stds": {"key": 3.0, "tempo": 30.0}},
+    ]
+    
+    tags = _generate_matching_tags(track_features, profiles)
+    
+    assert tags == [
+        ["Low Energy", "Positive Mood", "Acoustic", "Consistent Key", "Consistent Tempo"],
+        ["Low Energy", "Positive Mood", "Acoustic"],
+    ]
+
+
+def test_saved_tracks_stop_paging_after_first_unassigned(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test later pages of saved tracks are not fetched once a song is found."""
+    fake_spotify.saved = ["new-loud"] + [f"loud{i % 6}" for i in range(120)]
+    
+    response = client.get(
+        "/triage/next", headers={"Authorization": f"Bearer {mock_access_token}"}
+    )
+    
+    assert response.json()["song_to_sort"]["id"] == "new-loud"
+    saved_requests = [r for r in fake_spotify.requests if r.url.path == "/v1/me/tracks"]
+    assert len(saved_requests) == 1
+
+
+def test_remaining_pages_requested_by_offset(
+    client: TestClient, fake_spotify: FakeSpotify, mock_access_token: str
+):
+    """Test pages after the first are requested directly by offset."""
+    loud = [f"loud{i}" for i in range(250)]
+    fake_spotify.playlists["loud"] = loud
+    for i, track_id in enumerate(loud):
+        fake_spotify.features[track_id] = _features(track_id, 0.9, (i % 6) * 0.01)
+    
+    client.get("/triage/next", headers={"Authorization": f"Bearer {mock_access_token}"})
+    
+    offsets = {
+        r.url.params.get("offset")
+        for r in fake_spotify.requests
+        if r.url.path == "/v1/playlists/loud/tracks"
+    }
+    assert offsets == {None, "100", "200"}